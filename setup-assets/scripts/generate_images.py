@@ -5,8 +5,10 @@ Creates professional-looking gradient images with product names.
 """
 
 from PIL import Image, ImageDraw, ImageFont
+import numpy as np
+import io
 import os
-import math
+from concurrent.futures import ProcessPoolExecutor
 
 # Output directory
 OUTPUT_DIR = "/home/claude/matcha-setup/images"
@@ -47,54 +49,85 @@ GRADE_COLORS = {
     },
 }
 
+# Texture shades for the powder circle, derived once per palette
+for palette in GRADE_COLORS.values():
+    palette["accent_lighter"] = tuple(min(255, c + 30) for c in palette["accent"])
+    palette["accent_darker"] = tuple(max(0, c - 20) for c in palette["accent"])
+
+# Rendered grade backgrounds keyed by (palette name, size). The cache is per
+# process, so it only saves work because main sends each palette's products
+# to the same task.
+TEMPLATE_CACHE = {}
+
+
+def load_font(path, size):
+    """Load a TrueType font, falling back to Pillow's default font."""
+    try:
+        return ImageFont.truetype(path, size)
+    except (OSError, ImportError):
+        return ImageFont.load_default()
+
+
+# Fonts are parsed once at import rather than for every image
+FONT_LARGE = load_font("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 36)
+FONT_SMALL = load_font("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 24)
+FONT_PLACEHOLDER = load_font("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 48)
+
 
 def create_gradient(width, height, color1, color2, direction="diagonal"):
     """Create a gradient image."""
-    image = Image.new("RGB", (width, height))
-    draw = ImageDraw.Draw(image)
+    ys = np.arange(height)[:, None]
+    xs = np.arange(width)[None, :]
     
-    for y in range(height):
-        for x in range(width):
-            if direction == "diagonal":
-                # Diagonal gradient
-                ratio = (x + y) / (width + height)
-            elif direction == "vertical":
-                ratio = y / height
-            else:  # horizontal
-                ratio = x / width
-            
-            r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-            g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-            b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-            
-            draw.point((x, y), fill=(r, g, b))
+    # Blend ratio in 8-bit fixed point (0-256), computed in the default int
+    # dtype since (x + y) * 256 overflows uint16 for large images
+    if direction == "diagonal":
+        # Diagonal gradient
+        ratio = (xs + ys) * 256 // (width + height)
+    elif direction == "vertical":
+        ratio = np.broadcast_to(ys * 256 // height, (height, width))
+    else:  # horizontal
+        ratio = np.broadcast_to(xs * 256 // width, (height, width))
+    ratio = ratio.astype(np.uint16)
+    inverse = 256 - ratio
     
-    return image
+    # c * 256 <= 65280, so every blended channel fits in uint16
+    pixels = np.stack(
+        [
+            (np.uint16(color1[i]) * inverse + np.uint16(color2[i]) * ratio) >> 8
+            for i in range(3)
+        ],
+        axis=-1,
+    ).astype(np.uint8)
+    
+    return Image.fromarray(pixels, "RGB")
 
 
-def draw_matcha_powder_circle(draw, center_x, center_y, radius, color):
+def draw_matcha_powder_circle(draw, center_x, center_y, radius, color, lighter, darker):
     """Draw a stylized matcha powder circle with texture."""
     # Main circle
     draw.ellipse(
-        [center_x - radius, center_y - radius, center_x + radius, center_y + radius],
+        (center_x - radius, center_y - radius, center_x + radius, center_y + radius),
         fill=color,
         outline=None
     )
     
     # Add some texture dots for powder effect
-    import random
-    random.seed(42)  # Consistent texture
-    lighter = tuple(min(255, c + 30) for c in color)
-    darker = tuple(max(0, c - 20) for c in color)
+    rng = np.random.default_rng(42)  # Consistent texture
+    
+    count = 50
+    angles = rng.uniform(0, 2 * np.pi, count)
+    dists = rng.uniform(0, radius * 0.8, count)
+    sizes = rng.integers(2, 6, count)
+    picks = rng.random(count) > 0.5
+    xs = center_x + dists * np.cos(angles)
+    ys = center_y + dists * np.sin(angles)
+    bboxes = np.stack([xs - sizes, ys - sizes, xs + sizes, ys + sizes], axis=1)
     
-    for _ in range(50):
-        angle = random.uniform(0, 2 * math.pi)
-        dist = random.uniform(0, radius * 0.8)
-        x = center_x + dist * math.cos(angle)
-        y = center_y + dist * math.sin(angle)
-        size = random.randint(2, 5)
-        dot_color = lighter if random.random() > 0.5 else darker
-        draw.ellipse([x - size, y - size, x + size, y + size], fill=dot_color)
+    # PIL has no batch ellipse API, so only the drawing stays in Python
+    for bbox, pick in zip(map(tuple, bboxes.tolist()), picks.tolist()):
+        dot_color = lighter if pick else darker
+        draw.ellipse(bbox, fill=dot_color)
 
 
 def draw_tea_leaves(draw, x, y, size, color):
@@ -103,16 +136,20 @@ def draw_tea_leaves(draw, x, y, size, color):
     leaf_color = tuple(max(0, c - 30) for c in color)
     
     # Main leaf
-    draw.ellipse([x, y, x + size * 2, y + size], fill=leaf_color)
+    draw.ellipse((x, y, x + size * 2, y + size), fill=leaf_color)
     # Stem
-    draw.line([(x + size, y + size//2), (x + size, y + size + 10)], fill=leaf_color, width=2)
+    draw.line(((x + size, y + size//2), (x + size, y + size + 10)), fill=leaf_color, width=2)
 
 
-def generate_product_image(product, size=(800, 800)):
-    """Generate a product image for a matcha product."""
+def palette_for(grade):
+    """Return the GRADE_COLORS palette name used for a grade."""
+    return grade if grade in GRADE_COLORS else "Premium"
+
+
+def create_template(palette, size):
+    """Create the grade background shared by every product of that grade."""
     width, height = size
-    grade = product["grade"]
-    colors = GRADE_COLORS.get(grade, GRADE_COLORS["Premium"])
+    colors = GRADE_COLORS[palette]
     
     # Create gradient background
     image = create_gradient(width, height, colors["secondary"], colors["primary"], "diagonal")
@@ -121,7 +158,10 @@ def generate_product_image(product, size=(800, 800)):
     # Draw matcha powder circle in center
     center_x, center_y = width // 2, height // 2 - 50
     powder_radius = min(width, height) // 4
-    draw_matcha_powder_circle(draw, center_x, center_y, powder_radius, colors["accent"])
+    draw_matcha_powder_circle(
+        draw, center_x, center_y, powder_radius,
+        colors["accent"], colors["accent_lighter"], colors["accent_darker"],
+    )
     
     # Draw decorative tea leaves
     draw_tea_leaves(draw, width * 0.1, height * 0.1, 30, colors["primary"])
@@ -129,77 +169,122 @@ def generate_product_image(product, size=(800, 800)):
     draw_tea_leaves(draw, width * 0.15, height * 0.8, 20, colors["primary"])
     draw_tea_leaves(draw, width * 0.75, height * 0.85, 28, colors["primary"])
     
-    # Add product name text
-    try:
-        # Try to use a nice font, fall back to default
-        font_large = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 36)
-        font_small = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 24)
-    except:
-        font_large = ImageFont.load_default()
-        font_small = ImageFont.load_default()
+    # Add subtle border
+    border_color = colors["accent"]
+    draw.rectangle((0, 0, width-1, height-1), outline=border_color, width=3)
+    
+    return image
+
+
+def generate_product_image(product, size=(800, 800)):
+    """Generate a product image for a matcha product."""
+    width, height = size
+    grade = product["grade"]
+    palette = palette_for(grade)
+    
+    # Only the text differs between products of a grade, so draw it on a
+    # copy of the cached grade background
+    key = (palette, size)
+    template = TEMPLATE_CACHE.get(key)
+    if template is None:
+        template = create_template(palette, size)
+        TEMPLATE_CACHE[key] = template
+    image = template.copy()
+    draw = ImageDraw.Draw(image)
     
     # Product name
     name = product["name"]
-    bbox = draw.textbbox((0, 0), name, font=font_large)
+    bbox = draw.textbbox((0, 0), name, font=FONT_LARGE)
     text_width = bbox[2] - bbox[0]
     text_x = (width - text_width) // 2
     text_y = height - 150
     
     # Text shadow
-    draw.text((text_x + 2, text_y + 2), name, font=font_large, fill=(0, 0, 0, 128))
+    draw.text((text_x + 2, text_y + 2), name, font=FONT_LARGE, fill=(0, 0, 0, 128))
     # Main text
-    draw.text((text_x, text_y), name, font=font_large, fill=(255, 255, 255))
+    draw.text((text_x, text_y), name, font=FONT_LARGE, fill=(255, 255, 255))
     
     # Grade label
     grade_text = f"Grade: {grade}"
-    bbox = draw.textbbox((0, 0), grade_text, font=font_small)
+    bbox = draw.textbbox((0, 0), grade_text, font=FONT_SMALL)
     grade_width = bbox[2] - bbox[0]
     grade_x = (width - grade_width) // 2
-    draw.text((grade_x, text_y + 50), grade_text, font=font_small, fill=(255, 255, 255, 200))
-    
-    # Add subtle border
-    border_color = colors["accent"]
-    draw.rectangle([0, 0, width-1, height-1], outline=border_color, width=3)
+    draw.text((grade_x, text_y + 50), grade_text, font=FONT_SMALL, fill=(255, 255, 255, 200))
     
     return image
 
 
+def save_jpeg(image, filepath, quality):
+    """Encode an image as JPEG in memory and write it with a single write."""
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG", quality=quality, subsampling=2, optimize=False)
+    with open(filepath, "wb") as f:
+        f.write(buffer.getbuffer())
+
+
+def save_product_images(product):
+    """Generate and save the main image and thumbnail for one product."""
+    # Generate main image
+    image = generate_product_image(product, (800, 800))
+    filename = f"{product['slug']}.jpg"
+    filepath = os.path.join(OUTPUT_DIR, filename)
+    save_jpeg(image, filepath, quality=90)
+    
+    # Generate thumbnail
+    thumbnail = image.resize((400, 400), Image.Resampling.LANCZOS)
+    thumb_filename = f"{product['slug']}-thumb.jpg"
+    thumb_filepath = os.path.join(OUTPUT_DIR, thumb_filename)
+    save_jpeg(thumbnail, thumb_filepath, quality=85)
+    
+    return [filename, thumb_filename]
+
+
+def save_palette_images(products):
+    """Generate and save images for products that share a grade palette."""
+    filenames = []
+    for product in products:
+        filenames.extend(save_product_images(product))
+    return filenames
+
+
 def main():
     """Generate all product images."""
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     
     print("Generating product images...")
     
+    # Template caches are per process, so hand each task every product of one
+    # palette: its template is then rendered once and reused for the group.
+    groups = {}
     for product in PRODUCTS:
-        # Generate main image
-        image = generate_product_image(product, (800, 800))
-        filename = f"{product['slug']}.jpg"
-        filepath = os.path.join(OUTPUT_DIR, filename)
-        image.save(filepath, "JPEG", quality=90)
-        print(f"  ✓ Created: {filename}")
-        
-        # Generate thumbnail
-        thumbnail = image.copy()
-        thumbnail.thumbnail((400, 400))
-        thumb_filename = f"{product['slug']}-thumb.jpg"
-        thumb_filepath = os.path.join(OUTPUT_DIR, thumb_filename)
-        thumbnail.save(thumb_filepath, "JPEG", quality=85)
-        print(f"  ✓ Created: {thumb_filename}")
+        groups.setdefault(palette_for(product["grade"]), []).append(product)
+    groups = list(groups.values())
+    
+    # Groups write disjoint files, so they can be rendered in parallel.
+    # Use at most one process per core, and skip the pool entirely when only
+    # one would start since it cannot repay its startup cost.
+    workers = min(len(groups), os.cpu_count() or 1)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = -(-len(groups) // workers)
+            results = list(executor.map(save_palette_images, groups, chunksize=chunksize))
+    else:
+        results = [save_palette_images(group) for group in groups]
+    
+    for filenames in results:
+        for filename in filenames:
+            print(f"  ✓ Created: {filename}")
     
     # Create a placeholder for missing images
     placeholder = create_gradient(800, 800, (200, 200, 200), (150, 150, 150), "diagonal")
     draw = ImageDraw.Draw(placeholder)
-    try:
-        font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 48)
-    except:
-        font = ImageFont.load_default()
     
     text = "Image Coming Soon"
-    bbox = draw.textbbox((0, 0), text, font=font)
+    bbox = draw.textbbox((0, 0), text, font=FONT_PLACEHOLDER)
     text_width = bbox[2] - bbox[0]
-    draw.text(((800 - text_width) // 2, 380), text, font=font, fill=(100, 100, 100))
+    draw.text(((800 - text_width) // 2, 380), text, font=FONT_PLACEHOLDER, fill=(100, 100, 100))
     
-    placeholder.save(os.path.join(OUTPUT_DIR, "placeholder.jpg"), "JPEG", quality=85)
+    save_jpeg(placeholder, os.path.join(OUTPUT_DIR, "placeholder.jpg"), quality=85)
     print("  ✓ Created: placeholder.jpg")
     
     print(f"\n✅ Generated {len(PRODUCTS) * 2 + 1} images in {OUTPUT_DIR}")
@@ -7,13 +7,13 @@ Creates professional product spec documents with all relevant details.
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
 from reportlab.lib.colors import HexColor, black, white
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from reportlab.lib.utils import simpleSplit
 from reportlab.pdfgen import canvas
 from reportlab.lib import colors
 import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import repeat
 
 # Output directory
 OUTPUT_DIR = "/home/claude/matcha-setup/docs"
@@ -23,6 +23,18 @@ MATCHA_GREEN = HexColor("#4C8C4A")
 MATCHA_LIGHT = HexColor("#90BE6D")
 MATCHA_DARK = HexColor("#2D5A27")
 
+# Fixed page layout, in points
+PAGE_WIDTH, PAGE_HEIGHT = letter
+MARGIN_X = 0.75*inch
+MARGIN_TOP = 0.5*inch
+MARGIN_BOTTOM = 0.5*inch
+CONTENT_WIDTH = PAGE_WIDTH - 2 * MARGIN_X
+LABEL_WIDTH = 1.5*inch
+CELL_PADDING = 6
+ROW_HEIGHT = 16
+LINE_HEIGHT = 12
+SECTION_GAP = 14
+
 # Product data matching the seed.ts file
 PRODUCTS = [
     {
@@ -220,214 +232,191 @@ PRODUCTS = [
 ]
 
 
-def create_spec_sheet(product, output_path):
-    """Create a professional PDF specification sheet for a product."""
-    
-    doc = SimpleDocTemplate(
-        output_path,
-        pagesize=letter,
-        rightMargin=0.75*inch,
-        leftMargin=0.75*inch,
-        topMargin=0.5*inch,
-        bottomMargin=0.5*inch
-    )
+def draw_section_header(c, y, title):
+    """Draw a boxed section heading below y and return the next y."""
+    height = 20
+    c.setStrokeColor(MATCHA_GREEN)
+    c.setLineWidth(1)
+    c.rect(MARGIN_X, y - height, CONTENT_WIDTH, height, stroke=1, fill=0)
+    c.setFillColor(MATCHA_GREEN)
+    c.setFont("Helvetica-Bold", 14)
+    c.drawString(MARGIN_X + 4, y - height + 5, title)
+    return y - height - 6
+
+
+def draw_label_rows(c, y, rows, boxed=False):
+    """Draw label/value rows below y and return the next y."""
+    value_x = MARGIN_X + LABEL_WIDTH + CELL_PADDING
+    value_width = CONTENT_WIDTH - LABEL_WIDTH - 2 * CELL_PADDING
+    wrapped = [(label, simpleSplit(value, "Helvetica", 10, value_width)) for label, value in rows]
+    height = sum(ROW_HEIGHT + LINE_HEIGHT * (len(lines) - 1) for _, lines in wrapped)
     
-    styles = getSampleStyleSheet()
+    if boxed:
+        c.setFillColor(HexColor("#f5f5f5"))
+        c.setStrokeColor(MATCHA_GREEN)
+        c.setLineWidth(1)
+        c.rect(MARGIN_X, y - height, CONTENT_WIDTH, height, stroke=1, fill=1)
     
-    # Custom styles
-    styles.add(ParagraphStyle(
-        name='ProductTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=MATCHA_DARK,
-        spaceAfter=6,
-        alignment=TA_CENTER,
-    ))
+    for label, lines in wrapped:
+        baseline = y - 11
+        c.setFillColor(MATCHA_DARK)
+        c.setFont("Helvetica-Bold", 10)
+        c.drawString(MARGIN_X + CELL_PADDING, baseline, label)
+        c.setFillColor(black)
+        c.setFont("Helvetica", 10)
+        for line in lines:
+            c.drawString(value_x, baseline, line)
+            baseline -= LINE_HEIGHT
+        y -= ROW_HEIGHT + LINE_HEIGHT * (len(lines) - 1)
+    return y
+
+
+def draw_body_text(c, y, text, indent=0):
+    """Draw wrapped body text below y and return the next y."""
+    c.setFillColor(black)
+    c.setFont("Helvetica", 10)
+    for line in simpleSplit(text, "Helvetica", 10, CONTENT_WIDTH - indent):
+        c.drawString(MARGIN_X + indent, y - 11, line)
+        y -= 14
+    return y
+
+
+def draw_nutrition_table(c, y, product):
+    """Draw the three-column nutrition grid below y and return the next y."""
+    col_width = CONTENT_WIDTH / 3
+    row_height = 22
+    rows = [
+        ["Caffeine", "L-Theanine", "Catechins"],
+        [product['caffeine'], product['l_theanine'], product['catechins']],
+    ]
     
-    styles.add(ParagraphStyle(
-        name='SectionHeader',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=MATCHA_GREEN,
-        spaceBefore=12,
-        spaceAfter=6,
-        borderColor=MATCHA_GREEN,
-        borderWidth=1,
-        borderPadding=3,
-    ))
+    c.setFillColor(MATCHA_LIGHT)
+    c.rect(MARGIN_X, y - row_height, CONTENT_WIDTH, row_height, stroke=0, fill=1)
+    c.setStrokeColor(MATCHA_GREEN)
+    c.setLineWidth(1)
+    c.grid(
+        [MARGIN_X + i * col_width for i in range(4)],
+        [y - i * row_height for i in range(len(rows) + 1)],
+    )
     
-    styles.add(ParagraphStyle(
-        name='GradeLabel',
-        parent=styles['Normal'],
-        fontSize=12,
-        textColor=white,
-        alignment=TA_CENTER,
-        backColor=MATCHA_GREEN,
-    ))
+    c.setFillColor(black)
+    for r, (font, cells) in enumerate(zip(["Helvetica-Bold", "Helvetica"], rows)):
+        c.setFont(font, 10)
+        baseline = y - r * row_height - row_height / 2 - 3.5
+        for i, cell in enumerate(cells):
+            c.drawCentredString(MARGIN_X + (i + 0.5) * col_width, baseline, cell)
+    return y - len(rows) * row_height
+
+
+def create_spec_sheet(product, output_path, today):
+    """Create a professional PDF specification sheet for a product."""
+    c = canvas.Canvas(output_path, pagesize=letter)
     
-    styles.add(ParagraphStyle(
-        name='SpecBodyText',
-        parent=styles['Normal'],
-        fontSize=10,
-        leading=14,
-    ))
+    # Header with logo mark, product name and grade badge
+    header_top = PAGE_HEIGHT - MARGIN_TOP
+    header_height = 50
+    header_middle = header_top - header_height / 2
     
-    styles.add(ParagraphStyle(
-        name='SpecSmallText',
-        parent=styles['Normal'],
-        fontSize=8,
-        textColor=colors.gray,
-    ))
+    c.setFillColor(MATCHA_GREEN)
+    c.circle(MARGIN_X + 0.5*inch, header_middle, 16, stroke=0, fill=1)
     
-    story = []
+    c.setFillColor(MATCHA_DARK)
+    c.setFont("Helvetica-Bold", 24)
+    c.drawCentredString(MARGIN_X + 3.25*inch, header_middle - 8, product['name'])
     
-    # Header with logo placeholder and title
-    header_data = [
-        [
-            Paragraph("🍵", ParagraphStyle(name='Logo', fontSize=36, alignment=TA_CENTER)),
-            Paragraph(f"<b>{product['name']}</b>", styles['ProductTitle']),
-            Paragraph(f"<b>{product['grade']} Grade</b>", styles['GradeLabel']),
-        ]
-    ]
-    header_table = Table(header_data, colWidths=[1*inch, 4.5*inch, 1.5*inch])
-    header_table.setStyle(TableStyle([
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('ALIGN', (0, 0), (0, 0), 'CENTER'),
-        ('ALIGN', (1, 0), (1, 0), 'CENTER'),
-        ('ALIGN', (2, 0), (2, 0), 'CENTER'),
-        ('BACKGROUND', (2, 0), (2, 0), MATCHA_GREEN),
-        ('TEXTCOLOR', (2, 0), (2, 0), white),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-    ]))
-    story.append(header_table)
-    story.append(Spacer(1, 0.2*inch))
+    badge_x = MARGIN_X + CONTENT_WIDTH - 1.5*inch
+    c.setFillColor(MATCHA_GREEN)
+    c.rect(badge_x, header_middle - 18, 1.5*inch, 36, stroke=0, fill=1)
+    c.setFillColor(white)
+    c.setFont("Helvetica-Bold", 12)
+    c.drawCentredString(badge_x + 0.75*inch, header_middle + 2, product['grade'])
+    c.drawCentredString(badge_x + 0.75*inch, header_middle - 12, "Grade")
     
     # Subtitle with region and origin
-    story.append(Paragraph(
-        f"<i>Origin: {product['region']}, {product['origin']}</i>",
-        ParagraphStyle(name='Subtitle', fontSize=11, textColor=colors.gray, alignment=TA_CENTER)
-    ))
-    story.append(Spacer(1, 0.3*inch))
+    y = header_top - header_height - 14
+    c.setFillColor(colors.gray)
+    c.setFont("Helvetica-Oblique", 11)
+    c.drawCentredString(PAGE_WIDTH / 2, y, f"Origin: {product['region']}, {product['origin']}")
+    y -= 24
     
     # Product Overview Section
-    story.append(Paragraph("PRODUCT OVERVIEW", styles['SectionHeader']))
-    
-    overview_data = [
+    y = draw_section_header(c, y, "PRODUCT OVERVIEW")
+    y = draw_label_rows(c, y, [
         ["Harvest:", product['harvest']],
         ["Cultivation:", product['cultivation']],
         ["Processing:", product['processing']],
         ["Mesh Size:", product['mesh']],
-    ]
-    overview_table = Table(overview_data, colWidths=[1.5*inch, 5.5*inch])
-    overview_table.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('TEXTCOLOR', (0, 0), (0, -1), MATCHA_DARK),
-    ]))
-    story.append(overview_table)
-    story.append(Spacer(1, 0.2*inch))
+    ])
+    y -= SECTION_GAP
     
     # Sensory Profile Section
-    story.append(Paragraph("SENSORY PROFILE", styles['SectionHeader']))
-    
-    sensory_data = [
+    y = draw_section_header(c, y, "SENSORY PROFILE")
+    y = draw_label_rows(c, y, [
         ["Color:", product['color']],
         ["Flavor:", product['flavor']],
         ["Aroma:", product['aroma']],
-    ]
-    sensory_table = Table(sensory_data, colWidths=[1.5*inch, 5.5*inch])
-    sensory_table.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('TEXTCOLOR', (0, 0), (0, -1), MATCHA_DARK),
-    ]))
-    story.append(sensory_table)
-    story.append(Spacer(1, 0.2*inch))
+    ])
+    y -= SECTION_GAP
     
     # Nutritional Information Section
-    story.append(Paragraph("NUTRITIONAL INFORMATION (per gram)", styles['SectionHeader']))
-    
-    nutrition_data = [
-        ["Caffeine", "L-Theanine", "Catechins"],
-        [product['caffeine'], product['l_theanine'], product['catechins']],
-    ]
-    nutrition_table = Table(nutrition_data, colWidths=[2.33*inch, 2.33*inch, 2.34*inch])
-    nutrition_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), MATCHA_LIGHT),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 1, MATCHA_GREEN),
-    ]))
-    story.append(nutrition_table)
-    story.append(Spacer(1, 0.2*inch))
+    y = draw_section_header(c, y, "NUTRITIONAL INFORMATION (per gram)")
+    y = draw_nutrition_table(c, y, product)
+    y -= SECTION_GAP
     
     # Storage & Shelf Life Section
-    story.append(Paragraph("STORAGE & SHELF LIFE", styles['SectionHeader']))
-    
-    storage_data = [
+    y = draw_section_header(c, y, "STORAGE & SHELF LIFE")
+    y = draw_label_rows(c, y, [
         ["Shelf Life:", product['shelf_life']],
         ["Storage:", product['storage']],
-    ]
-    storage_table = Table(storage_data, colWidths=[1.5*inch, 5.5*inch])
-    storage_table.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('TEXTCOLOR', (0, 0), (0, -1), MATCHA_DARK),
-    ]))
-    story.append(storage_table)
-    story.append(Spacer(1, 0.2*inch))
+    ])
+    y -= SECTION_GAP
     
     # Certifications Section
     if product['certifications']:
-        story.append(Paragraph("CERTIFICATIONS", styles['SectionHeader']))
-        certs = " • ".join(product['certifications'])
-        story.append(Paragraph(f"✓ {certs}", styles['SpecBodyText']))
-        story.append(Spacer(1, 0.2*inch))
+        y = draw_section_header(c, y, "CERTIFICATIONS")
+        c.setFillColor(MATCHA_GREEN)
+        c.setFont("ZapfDingbats", 10)
+        c.drawString(MARGIN_X, y - 11, "✓")
+        y = draw_body_text(c, y, " • ".join(product['certifications']), indent=14)
+        y -= SECTION_GAP
     
     # Recommended Uses Section
-    story.append(Paragraph("RECOMMENDED USES", styles['SectionHeader']))
-    uses = " • ".join(product['uses'])
-    story.append(Paragraph(uses, styles['SpecBodyText']))
-    story.append(Spacer(1, 0.2*inch))
+    y = draw_section_header(c, y, "RECOMMENDED USES")
+    y = draw_body_text(c, y, " • ".join(product['uses']))
+    y -= SECTION_GAP
     
     # Ordering Information Section
-    story.append(Paragraph("ORDERING INFORMATION", styles['SectionHeader']))
-    
-    order_data = [
+    y = draw_section_header(c, y, "ORDERING INFORMATION")
+    draw_label_rows(c, y, [
         ["Minimum Order:", product['moq']],
         ["Lead Time:", product['lead_time']],
         ["Price Range:", product['price_range']],
-    ]
-    order_table = Table(order_data, colWidths=[1.5*inch, 5.5*inch])
-    order_table.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('TEXTCOLOR', (0, 0), (0, -1), MATCHA_DARK),
-        ('BACKGROUND', (0, 0), (-1, -1), HexColor("#f5f5f5")),
-        ('BOX', (0, 0), (-1, -1), 1, MATCHA_GREEN),
-    ]))
-    story.append(order_table)
-    story.append(Spacer(1, 0.3*inch))
+    ], boxed=True)
     
-    # Footer
-    story.append(Paragraph(
-        f"<i>Document generated: {datetime.now().strftime('%Y-%m-%d')} | Matcha Trading Platform</i>",
-        styles['SpecSmallText']
-    ))
-    story.append(Paragraph(
-        "<i>For the most current information, please contact your sales representative.</i>",
-        styles['SpecSmallText']
-    ))
+    # Footer, pinned to the bottom margin
+    c.setFillColor(colors.gray)
+    c.setFont("Helvetica-Oblique", 8)
+    c.drawString(
+        MARGIN_X,
+        MARGIN_BOTTOM + 10,
+        f"Document generated: {today} | Matcha Trading Platform",
+    )
+    c.drawString(
+        MARGIN_X,
+        MARGIN_BOTTOM,
+        "For the most current information, please contact your sales representative.",
+    )
     
-    # Build the PDF
-    doc.build(story)
+    c.showPage()
+    c.save()
+
+
+def save_spec_sheet(product, today):
+    """Generate and save the specification sheet for one product."""
+    filename = f"{product['slug']}-spec.pdf"
+    filepath = os.path.join(OUTPUT_DIR, filename)
+    create_spec_sheet(product, filepath, today)
+    return filename
 
 
 def main():
@@ -436,10 +425,21 @@ def main():
     
     print("Generating PDF specification sheets...")
     
-    for product in PRODUCTS:
-        filename = f"{product['slug']}-spec.pdf"
-        filepath = os.path.join(OUTPUT_DIR, filename)
-        create_spec_sheet(product, filepath)
+    # Every sheet in a run carries the same generation date
+    today = datetime.now().strftime('%Y-%m-%d')
+    
+    # Each product writes its own file, so they can be built in parallel.
+    # Use at most one process per core, and skip the pool entirely when only
+    # one would start since it cannot repay its startup cost.
+    workers = min(len(PRODUCTS), os.cpu_count() or 1)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = -(-len(PRODUCTS) // workers)
+            filenames = list(executor.map(save_spec_sheet, PRODUCTS, repeat(today), chunksize=chunksize))
+    else:
+        filenames = [save_spec_sheet(product, today) for product in PRODUCTS]
+    
+    for filename in filenames:
         print(f"  ✓ Created: {filename}")
     
     print(f"\n✅ Generated {len(PRODUCTS)} PDF specification sheets in {OUTPUT_DIR}")